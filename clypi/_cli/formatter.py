@@ -11,15 +11,20 @@ if t.TYPE_CHECKING:
     from clypi.cli import Command, _Argument
 
 
+# These never change so there's no need to style them on every help page
+_OPTIONS_USAGE = " [" + clypi.style("OPTIONS", fg="blue", bold=True) + "]"
+_COMMAND_USAGE = clypi.style(" COMMAND", fg="blue", bold=True)
+
+
 @dataclass
 class ProgramConfig:
     prog: str
 
 
-def _ext(ls: list[str], s: str | list[str] | None) -> None:
+def _ext(ls: list[str], s: str | t.Iterable[str] | None) -> None:
     if isinstance(s, str):
         ls.append(s)
-    elif isinstance(s, list):
+    elif s is not None:
         ls.extend(s)
     return None
 
@@ -87,10 +92,8 @@ class TermFormatter:
             short_usage.append(su)
             type_str.append(ts)
             help.append(hp)
-        return list(
-            boxed(
-                stack(usage, short_usage, type_str, help, lines=True), title="Options"
-            )
+        return boxed(
+            stack(usage, short_usage, type_str, help, lines=True), title="Options"
         )
 
     def _format_positional(self, positional: _Argument) -> t.Any:
@@ -113,7 +116,7 @@ class TermFormatter:
             name.append(n)
             type_str.append(ts)
             help.append(hp)
-        return list(boxed(stack(name, type_str, help, lines=True), title="Arguments"))
+        return boxed(stack(name, type_str, help, lines=True), title="Arguments")
 
     def _format_subcommand(self, subcmd: type[Command]) -> tuple[str, str]:
         name = clypi.style(subcmd.prog(), fg="blue", bold=True)
@@ -130,25 +133,20 @@ class TermFormatter:
             n, hp = self._format_subcommand(p)
             name.append(n)
             help.append(hp)
-        return list(boxed(stack(name, help, lines=True), title="Subcommands"))
+        return boxed(stack(name, help, lines=True), title="Subcommands")
 
     def _format_header(self) -> list[str] | str | None:
         prefix = clypi.style("Usage:", fg="yellow")
         prog = clypi.style(" ".join(self.prog), bold=True)
 
-        options = (
-            " [" + clypi.style("OPTIONS", fg="blue", bold=True) + "]"
-            if self.options
-            else ""
-        )
-        command = (
-            clypi.style(" COMMAND", fg="blue", bold=True) if self.subcommands else ""
-        )
+        options = _OPTIONS_USAGE if self.options else ""
+        command = _COMMAND_USAGE if self.subcommands else ""
         positional = (
             " "
-            + " ".join(
-                clypi.style(p.name.upper(), fg="blue", bold=True)
-                for p in self.positionals
+            + clypi.style(
+                " ".join(p.name.upper() for p in self.positionals),
+                fg="blue",
+                bold=True,
             )
             if self.positionals
             else ""
@@ -164,9 +162,7 @@ class TermFormatter:
     def _format_exception(self) -> list[str] | str | None:
         if not self.exception:
             return ""
-        return list(
-            boxed(_pretty_traceback(self.exception), title="Error", color="red")
-        )
+        return boxed(_pretty_traceback(self.exception), title="Error", color="red")
 
     def format_help(self) -> str:
         lines: list[str] = []
@@ -38,6 +38,10 @@ class Arg:
     value: str
     orig: str
     arg_type: t.Literal["long-opt", "short-opt", "pos"]
+    orig_lower: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.orig_lower = self.orig.lower()
 
     def is_pos(self):
         return self.arg_type == "pos"
@@ -1,23 +1,56 @@
-def distance(this: str, other: str) -> int:
-    if not this or not other:
-        return max(len(this), len(other))
+import importlib.util
+
+HAS_LEVENSHTEIN = importlib.util.find_spec("Levenshtein") is not None
+
+
+def distance(this: str, other: str, max_dist: int | None = None) -> int:
+    """
+    Computes the Levenshtein distance between two strings. If max_dist is
+    provided, the computation stops early as soon as the distance is known
+    to exceed it, and max_dist + 1 is returned instead.
+
+    Uses the C implementation from the `Levenshtein` package if installed.
+    """
+    if HAS_LEVENSHTEIN:
+        import Levenshtein  # type: ignore
+
+        try:
+            return Levenshtein.distance(this, other, score_cutoff=max_dist)
+        except TypeError:
+            # Older releases (python-Levenshtein) don't take keyword arguments
+            pass
 
+    return _py_distance(this, other, max_dist)
+
+
+def _py_distance(this: str, other: str, max_dist: int | None = None) -> int:
     n, m = len(this), len(other)
-    dist = [[0 for _ in range(m + 1)] for _ in range(n + 1)]
 
-    # Prepopulate first X and Y axis
-    for t in range(0, n + 1):
-        dist[t][0] = t
-    for o in range(0, m + 1):
-        dist[0][o] = o
+    # The distance is at least the difference in length
+    if max_dist is not None and abs(n - m) > max_dist:
+        return max_dist + 1
+
+    if not this or not other:
+        return max(n, m)
+
+    # Prepopulate first row
+    prev = list(range(m + 1))
 
-    # Compute actions
+    # Compute actions one row at a time
     for t in range(n):
+        curr = [t + 1] + [0] * m
         for o in range(m):
-            insertion = dist[t][o + 1] + 1
-            deletion = dist[t + 1][o] + 1
-            substitution = dist[t][o] + (1 if this[t] != other[o] else 0)
-            dist[t + 1][o + 1] = min(insertion, deletion, substitution)
+            insertion = prev[o + 1] + 1
+            deletion = curr[o] + 1
+            substitution = prev[o] + (1 if this[t] != other[o] else 0)
+            curr[o + 1] = min(insertion, deletion, substitution)
+
+        # Values in a row never decrease in the next ones
+        if max_dist is not None and min(curr) > max_dist:
+            return max_dist + 1
+        prev = curr
 
     # Get bottom right of computed matrix
-    return dist[n][m]
+    if max_dist is not None and prev[m] > max_dist:
+        return max_dist + 1
+    return prev[m]
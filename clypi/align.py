@@ -33,10 +33,12 @@ def _center(s: str, width: int):
 
 AlignType: t.TypeAlias = t.Literal["left", "center", "right"]
 
+_ALIGNERS: dict[AlignType, t.Callable[[str, int], str]] = {
+    "left": _ljust,
+    "right": _rjust,
+    "center": _center,
+}
+
 
 def align(s: str, alignment: AlignType, width: int) -> str:
-    if alignment == "left":
-        return _ljust(s, width)
-    if alignment == "right":
-        return _rjust(s, width)
-    return _center(s, width)
+    return _ALIGNERS.get(alignment, _center)(s, width)
@@ -2,9 +2,8 @@ import os
 import typing as t
 
 from clypi._data.boxes import Boxes as _Boxes
-from clypi.align import AlignType
-from clypi.align import align as _align
-from clypi.colors import ColorType, styler
+from clypi.align import _ALIGNERS, AlignType
+from clypi.colors import ColorType, _ansi_prefix
 
 Boxes = _Boxes
 
@@ -23,7 +22,7 @@ def boxed(
     width = width or os.get_terminal_size().columns
     box = style.value
 
-    c = styler(fg=color)
+    prefix, suffix = _ansi_prefix(fg=color)
 
     # Top bar
     def iter(lines: t.Iterable[str]):
@@ -35,15 +34,17 @@ def boxed(
             title = f" {title} "
         else:
             title = ""
-        yield c(box.tl + box.x + title + box.x * top_bar_width + box.tr)
+        yield prefix + box.tl + box.x + title + box.x * top_bar_width + box.tr + suffix
 
         # Body
+        border = prefix + box.y + suffix
+        aligner = _ALIGNERS.get(align, _ALIGNERS["center"])
         for line in lines:
-            aligned = _align(line, align, width - 2 - 2)
-            yield c(box.y) + " " + aligned + " " + c(box.y)
+            aligned = aligner(line, width - 2 - 2)
+            yield border + " " + aligned + " " + border
 
         # Footer
-        yield c(box.bl + box.x * (width - 2) + box.br)
+        yield prefix + box.bl + box.x * (width - 2) + box.br + suffix
 
     if isinstance(lines, list):
         return t.cast(T, list(iter(lines)))
@@ -7,6 +7,8 @@ import re
 import sys
 import typing as t
 from dataclasses import dataclass
+from dataclasses import field as dc_field
+from enum import Enum, auto
 from types import NoneType, UnionType
 
 from clypi._cli import autocomplete as _auto
@@ -22,14 +24,27 @@ logger = logging.getLogger(__name__)
 # re-exports
 config = _conf.config
 
-HELP_ARGS: tuple[str, ...] = ("help", "-h", "--help")
+HELP_ARGS: frozenset[str] = frozenset(("help", "-h", "--help"))
+
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
 
 
 def _camel_to_dashed(s: str):
-    return re.sub(r"(?<!^)(?=[A-Z])", "-", s).lower()
+    return _CAMEL_RE.sub("-", s).lower()
+
+
+class _Resolution(Enum):
+    """
+    How to get a field's value when the user did not pass it in
+    """
+
+    PROMPT = auto()
+    DEFAULT = auto()
+    FORWARDED = auto()
+    REQUIRED = auto()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class _Argument:
     name: str
     arg_type: t.Any
@@ -37,8 +52,15 @@ class _Argument:
     is_opt: bool = False
     short: str | None = None
 
-    @property
-    def nargs(self) -> parser.Nargs:
+    # Derived from the fields above, computed once on creation
+    nargs: parser.Nargs = dc_field(init=False)
+    display_name: str = dc_field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "nargs", self._get_nargs())
+        object.__setattr__(self, "display_name", self._get_display_name())
+
+    def _get_nargs(self) -> parser.Nargs:
         if self.arg_type is bool:
             return 0
 
@@ -51,8 +73,7 @@ class _Argument:
 
         return 1
 
-    @property
-    def display_name(self):
+    def _get_display_name(self) -> str:
         name = parser.snake_to_dash(self.name)
         if self.is_opt:
             return f"--{name}"
@@ -65,19 +86,32 @@ class _Argument:
         return f"-{name}"
 
 
-class _CommandMeta(type):
-    def __init__(cls, name, bases, dct) -> None:
-        cls._configure_fields()
-        cls._configure_subcommands()
+class Command:
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._configure()
 
     @t.final
-    def _configure_fields(cls) -> None:
+    @classmethod
+    def _configure(cls) -> None:
         """
-        Parses the type hints from the class extending Command and assigns each
-        a _Config field with all the necessary info to display and parse them.
+        Computes everything we need to know about the command's arguments
+        and subcommands once, when the class is created
         """
+        setattr(cls, "__clypi_prog__", _camel_to_dashed(cls.__name__))
+
         annotations: dict[str, t.Any] = inspect.get_annotations(cls, eval_str=True)
+        cls._configure_fields(annotations)
+        cls._configure_subcommands(annotations)
+        cls._configure_subcommands_map()
 
+    @t.final
+    @classmethod
+    def _configure_fields(cls, annotations: dict[str, t.Any]) -> None:
+        """
+        Parses the type hints from the class extending Command and assigns each
+        a _Config field with all the necessary info to display and parse them.
+        """
         # Ensure each field is annotated
         for name, value in cls.__dict__.items():
             if (
@@ -119,13 +153,61 @@ class _CommandMeta(type):
 
         setattr(cls, "__clypi_fields__", fields)
 
+        # Decide once how each field is resolved if the user doesn't pass it in
+        plan: list[tuple[str, _conf.Config[t.Any], _Resolution]] = []
+        for field, field_conf in fields.items():
+            if field_conf.prompt is not None:
+                resolution = _Resolution.PROMPT
+            elif field_conf.has_default():
+                resolution = _Resolution.DEFAULT
+            elif field_conf.forwarded:
+                resolution = _Resolution.FORWARDED
+            else:
+                resolution = _Resolution.REQUIRED
+            plan.append((field, field_conf, resolution))
+        setattr(cls, "__clypi_resolution_plan__", plan)
+
+        # Split the fields into options and positionals once so that we don't
+        # have to rebuild them every time we parse an argument
+        options: dict[str, _Argument] = {}
+        positionals: dict[str, _Argument] = {}
+        for field, field_conf in fields.items():
+            if field_conf.forwarded:
+                continue
+
+            # Is option
+            if field_conf.has_default() or field_conf.prompt is not None:
+                options[field] = _Argument(
+                    field,
+                    type_util.remove_optionality(field_conf.arg_type),
+                    help=field_conf.help,
+                    short=field_conf.short,
+                    is_opt=True,
+                )
+
+            # Is positional
+            else:
+                positionals[field] = _Argument(
+                    field,
+                    field_conf.arg_type,
+                    help=field_conf.help,
+                )
+
+        setattr(cls, "__clypi_options__", options)
+        setattr(cls, "__clypi_positionals__", positionals)
+
+        # Map short option names to their long name for quick lookups. Only
+        # options can be passed in by their short name
+        shorts = {opt.short: name for name, opt in options.items() if opt.short}
+        setattr(cls, "__clypi_shorts__", shorts)
+
     @t.final
-    def _configure_subcommands(cls) -> None:
+    @classmethod
+    def _configure_subcommands(cls, annotations: dict[str, t.Any]) -> None:
         """
         Parses the type hints from the class extending Command and stores the
         subcommand class if any
         """
-        annotations: dict[str, t.Any] = inspect.get_annotations(cls, eval_str=True)
         if "subcommand" not in annotations:
             return
 
@@ -147,26 +229,63 @@ class _CommandMeta(type):
 
         setattr(cls, "__clypi_subcommands__", subcmds)
 
-
-class Command(metaclass=_CommandMeta):
+    @t.final
     @classmethod
-    def prog(cls) -> str:
-        return _camel_to_dashed(cls.__name__)
+    def _configure_subcommands_map(cls) -> None:
+        """
+        Maps each subcommand's prog to its class. If the subcommand is optional,
+        None is also mapped to None
+        """
+        subcmds: list[type[Command] | type[None]] | None = getattr(
+            cls, "__clypi_subcommands__", None
+        )
+        if subcmds is None:
+            setattr(cls, "__clypi_subcommands_map__", {None: None})
+            setattr(cls, "__clypi_subcommand_list__", [])
+            return
 
-    @classmethod
-    def epilog(cls) -> str | None:
-        return None
+        ret: dict[str | None, type[Command] | None] = {}
+        for sub in subcmds:
+            if issubclass(sub, Command):
+                ret[sub.prog()] = sub
+            else:
+                ret[None] = None
+        setattr(cls, "__clypi_subcommands_map__", ret)
+
+        # The actual subcommand classes, without the optional None
+        setattr(cls, "__clypi_subcommand_list__", [s for s in ret.values() if s])
 
     @t.final
     @classmethod
-    def help(cls):
+    def _configure_help(cls) -> None:
+        """
+        Stores the class' docstring as a single line to display in the help page.
+        Done lazily since class decorators (e.g.: dataclass) can change the
+        docstring after the class is created
+        """
         doc = inspect.getdoc(cls)
 
         # Dataclass sets a default docstring so ignore that
         if not doc or doc.startswith(cls.__name__ + "("):
-            return None
+            setattr(cls, "__clypi_help__", None)
+            return
+
+        setattr(cls, "__clypi_help__", doc.replace("\n", " "))
+
+    @classmethod
+    def prog(cls) -> str:
+        return getattr(cls, "__clypi_prog__")
 
-        return doc.replace("\n", " ")
+    @classmethod
+    def epilog(cls) -> str | None:
+        return None
+
+    @t.final
+    @classmethod
+    def help(cls) -> str | None:
+        if "__clypi_help__" not in cls.__dict__:
+            cls._configure_help()
+        return cls.__dict__["__clypi_help__"]
 
     async def run(self) -> None:
         """
@@ -214,15 +333,6 @@ class Command(metaclass=_CommandMeta):
 
         return None
 
-    @t.final
-    @classmethod
-    def _get_long_name(cls, short: str) -> str | None:
-        fields = cls.fields()
-        for field, field_conf in fields.items():
-            if field_conf.short == short:
-                return field
-        return None
-
     @t.final
     @classmethod
     def _find_similar_exc(cls, arg: parser.Arg) -> ValueError:
@@ -238,15 +348,15 @@ class Command(metaclass=_CommandMeta):
                 *[p.name for p in cls.positionals().values()],
             ]
             for pos in all_pos:
-                if distance(pos, arg.value) < 3:
+                if distance(pos, arg.value, max_dist=2) <= 2:
                     similar = pos
                     break
         else:
             for opt in cls.options().values():
-                if distance(opt.name, arg.value) <= 2:
+                if distance(opt.name, arg.value, max_dist=2) <= 2:
                     similar = opt.display_name
                     break
-                if opt.short and distance(opt.short, arg.value) <= 1:
+                if opt.short and distance(opt.short, arg.value, max_dist=1) <= 1:
                     similar = opt.short_display_name
                     break
 
@@ -264,18 +374,27 @@ class Command(metaclass=_CommandMeta):
         args: t.Iterator[str],
         parents: list[str],
         parent_attrs: dict[str, str | list[str]] | None = None,
+        *,
+        requested_help: bool,
+        autocomplete: bool,
     ) -> t.Self:
         """
         Tries parsing args and if an error is shown, it displays the subcommand
         that failed the parsing's help page.
         """
         try:
-            return cls._parse(args, parents, parent_attrs)
+            return cls._parse(
+                args,
+                parents,
+                parent_attrs,
+                requested_help=requested_help,
+                autocomplete=autocomplete,
+            )
         except (ValueError, TypeError) as e:
             # The user might have started typing a subcommand but not
             # finished it so we cannot fully parse it, but we can recommend
             # the current command's args to autocomplete it
-            if _auto.get_autocomplete_args() is not None:
+            if autocomplete:
                 _auto.list_arguments(cls)
 
             # Otherwise, help page
@@ -290,6 +409,9 @@ class Command(metaclass=_CommandMeta):
         args: t.Iterator[str],
         parents: list[str],
         parent_attrs: dict[str, str | list[str]] | None = None,
+        *,
+        requested_help: bool,
+        autocomplete: bool,
     ) -> t.Self:
         """
         Given an iterator of arguments we recursively parse all options, arguments,
@@ -317,38 +439,40 @@ class Command(metaclass=_CommandMeta):
         # The subcommand we need to parse
         subcommand: type[Command] | None = None
 
-        requested_help = sys.argv[-1].lower() in HELP_ARGS
+        # Bind everything the loop needs locally since it runs once per token
+        subcommands = cls.subcommands()
+        options = cls.options()
+        shorts: dict[str, str] = getattr(cls, "__clypi_shorts__")
+        parse_as_attr = parser.parse_as_attr
+
         for a in args:
-            parsed = parser.parse_as_attr(a)
-            if parsed.orig.lower() in HELP_ARGS:
+            # Most tokens are plain values, so only classify the ones that look like options
+            if a and a[0] != "-":
+                parsed = parser.Arg(value=a, orig=a, arg_type="pos")
+            else:
+                parsed = parse_as_attr(a)
+            kind = parsed.arg_type
+
+            if parsed.orig_lower in HELP_ARGS:
                 cls.print_help(parents=parents)
 
             # ---- Try to parse as a subcommand ----
-            if parsed.is_pos() and parsed.value in cls.subcommands():
-                subcommand = cls.subcommands()[parsed.value]
+            if kind == "pos" and parsed.value in subcommands:
+                subcommand = subcommands[parsed.value]
                 break
 
             # ---- Try to set to the current option ----
-            is_valid_long = (
-                not parsed.is_pos()
-                and parsed.is_long_opt()
-                and parsed.value in cls.options()
-            )
-            is_valid_short = (
-                not parsed.is_pos()
-                and parsed.is_short_opt()
-                and cls._get_long_name(parsed.value) is not None
-            )
-            if (
-                parsed.is_short_opt()
-                or parsed.is_long_opt()
-                and not (is_valid_long or is_valid_short)
-            ):
+            long_name: str | None = None
+            if kind == "long-opt" and parsed.value in options:
+                long_name = parsed.value
+            elif kind == "short-opt":
+                long_name = shorts.get(parsed.value)
+
+            if kind != "pos" and long_name is None:
                 raise cls._find_similar_exc(parsed)
 
-            if is_valid_long or is_valid_short:
-                long_name = cls._get_long_name(parsed.value) or parsed.value
-                option = cls.options()[long_name]
+            if long_name is not None:
+                option = options[long_name]
                 flush_ctx()
 
                 # Boolean flags don't need to parse more args later on
@@ -384,11 +508,16 @@ class Command(metaclass=_CommandMeta):
         parsed_kwargs = {}
         if not requested_help:
             # --- Parse as the correct values ---
-            for field, field_conf in cls.fields().items():
+            plan: list[tuple[str, _conf.Config[t.Any], _Resolution]] = getattr(
+                cls, "__clypi_resolution_plan__"
+            )
+            for field, field_conf, resolution in plan:
                 # Get the value passed in, prompt, or the provided default
                 if field in unparsed:
                     value = field_conf.parser(unparsed[field])
-                elif field_conf.prompt is not None:
+                elif resolution is _Resolution.PROMPT:
+                    if t.TYPE_CHECKING:
+                        assert field_conf.prompt is not None
                     value = prompt(
                         field_conf.prompt,
                         default=field_conf.get_default_or_missing(),
@@ -396,9 +525,9 @@ class Command(metaclass=_CommandMeta):
                         max_attempts=field_conf.max_attempts,
                         parser=field_conf.parser,
                     )
-                elif field_conf.has_default():
+                elif resolution is _Resolution.DEFAULT:
                     value = field_conf.get_default()
-                elif field_conf.forwarded:
+                elif resolution is _Resolution.FORWARDED:
                     if field not in parent_attrs:
                         raise ValueError(f"Missing required argument {field}")
                     value = parent_attrs[field]
@@ -409,13 +538,15 @@ class Command(metaclass=_CommandMeta):
                 parsed_kwargs[field] = value
 
         # --- Parse the subcommand passing in the parsed types ---
-        if not subcommand and None not in cls.subcommands():
+        if not subcommand and None not in subcommands:
             raise ValueError("Missing required subcommand")
         elif subcommand:
             parsed_kwargs["subcommand"] = subcommand._safe_parse(
                 args,
                 parents=parents + [cls.prog()],
                 parent_attrs=parsed_kwargs,
+                requested_help=requested_help,
+                autocomplete=autocomplete,
             )
 
         # Assign to an instance
@@ -427,60 +558,17 @@ class Command(metaclass=_CommandMeta):
     @t.final
     @classmethod
     def subcommands(cls) -> dict[str | None, type[Command] | None]:
-        subcmds = t.cast(
-            list[type[Command] | type[None]] | None,
-            getattr(cls, "__clypi_subcommands__", None),
-        )
-        if subcmds is None:
-            return {None: None}
-
-        ret: dict[str | None, type[Command] | None] = {}
-        for sub in subcmds:
-            if issubclass(sub, Command):
-                ret[sub.prog()] = sub
-            else:
-                ret[None] = None
-        return ret
+        return getattr(cls, "__clypi_subcommands_map__")
 
     @t.final
     @classmethod
     def options(cls) -> dict[str, _Argument]:
-        options: dict[str, _Argument] = {}
-        for field, field_conf in cls.fields().items():
-            if field_conf.forwarded:
-                continue
-
-            # Is positional
-            if not field_conf.has_default() and field_conf.prompt is None:
-                continue
-
-            options[field] = _Argument(
-                field,
-                type_util.remove_optionality(field_conf.arg_type),
-                help=field_conf.help,
-                short=field_conf.short,
-                is_opt=True,
-            )
-        return options
+        return getattr(cls, "__clypi_options__")
 
     @t.final
     @classmethod
     def positionals(cls) -> dict[str, _Argument]:
-        options: dict[str, _Argument] = {}
-        for field, field_conf in cls.fields().items():
-            if field_conf.forwarded:
-                continue
-
-            # Is option
-            if field_conf.has_default() or field_conf.prompt is not None:
-                continue
-
-            options[field] = _Argument(
-                field,
-                field_conf.arg_type,
-                help=field_conf.help,
-            )
-        return options
+        return getattr(cls, "__clypi_positionals__")
 
     @t.final
     @classmethod
@@ -496,13 +584,22 @@ class Command(metaclass=_CommandMeta):
 
         # If this is an autocomplete call, we need the args from the env var passed in
         # by the shell's complete function
-        if auto_args := _auto.get_autocomplete_args():
+        auto_args = _auto.get_autocomplete_args()
+        if auto_args:
             args = auto_args
 
+        # If the user requested help, we skip prompting/parsing at every level
+        requested_help = bool(args) and args[-1].lower() in HELP_ARGS
+
         norm_args = parser.normalize_args(args)
         args_iter = iter(norm_args)
-        instance = cls._safe_parse(args_iter, parents=[])
-        if _auto.get_autocomplete_args() is not None:
+        instance = cls._safe_parse(
+            args_iter,
+            parents=[],
+            requested_help=requested_help,
+            autocomplete=auto_args is not None,
+        )
+        if auto_args is not None:
             _auto.list_arguments(cls)
         if list(args_iter):
             raise ValueError(f"Unknown arguments {list(args_iter)}")
@@ -518,7 +615,7 @@ class Command(metaclass=_CommandMeta):
             epilog=cls.epilog(),
             options=list(cls.options().values()),
             positionals=list(cls.positionals().values()),
-            subcommands=[s for s in cls.subcommands().values() if s],
+            subcommands=getattr(cls, "__clypi_subcommand_list__"),
             exception=exception,
         )
         print(tf.format_help())
@@ -531,3 +628,7 @@ class Command(metaclass=_CommandMeta):
             if v is not None and not k.startswith("_")
         )
         return f"{self.__class__.__name__}({fields})"
+
+
+# __init_subclass__ only runs for subclasses so configure the base class too
+Command._configure()
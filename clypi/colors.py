@@ -1,11 +1,13 @@
-import builtins
+import functools
 import re
+import sys
 import typing as t
 from enum import Enum
 
 from clypi.const import ESC
 
-ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+# Possessive quantifiers so malformed sequences can't cause any backtracking
+ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*+[ -/]*+[@-~])")
 END = "m"
 
 FG_OFFSET = 30
@@ -71,20 +73,6 @@ def _color_code(color: ColorType, offset: int) -> int:
     return _color_codes[key] + offset
 
 
-def _apply_color(s: str, color: ColorType, offset: int) -> str:
-    start = _color_code(color, offset)
-    end = _color_code("default", offset)
-    return f"{_code(start)}{s}{_code(end)}"
-
-
-def _apply_fg(text: str, fg: ColorType):
-    return _apply_color(text, fg, FG_OFFSET)
-
-
-def _apply_bg(text: str, bg: ColorType):
-    return _apply_color(text, bg, BG_OFFSET)
-
-
 class StyleCode(Enum):
     BOLD = 1
     DIM = 2
@@ -95,23 +83,132 @@ class StyleCode(Enum):
     STRIKETHROUGH = 9
 
 
-def _apply_style(s: str, style: StyleCode) -> str:
-    start = style.value + STYLE_ON_OFFSET
-    return f"{_code(start)}{s}{_code(0)}"
+# Sequences to undo styles, shared by every styled string
+_RESET_ALL: t.Final = _code(0)
+_FG_RESET: t.Final = _code(_color_code("default", FG_OFFSET))
+_BG_RESET: t.Final = _code(_color_code("default", BG_OFFSET))
 
+# The (start, end) escape sequences for every color
+_FG_WRAP: dict[str, tuple[str, str]] = {
+    color: (_code(_color_code(color, FG_OFFSET)), _FG_RESET) for color in ALL_COLORS
+}
+_BG_WRAP: dict[str, tuple[str, str]] = {
+    color: (_code(_color_code(color, BG_OFFSET)), _BG_RESET) for color in ALL_COLORS
+}
+
+# Plain strings for each style so we don't go through the enum when styling
+_BOLD_ON = _code(StyleCode.BOLD.value + STYLE_ON_OFFSET)
+_DIM_ON = _code(StyleCode.DIM.value + STYLE_ON_OFFSET)
+_ITALIC_ON = _code(StyleCode.ITALIC.value + STYLE_ON_OFFSET)
+_UNDERLINE_ON = _code(StyleCode.UNDERLINE.value + STYLE_ON_OFFSET)
+_BLINK_ON = _code(StyleCode.BLINK.value + STYLE_ON_OFFSET)
+_REVERSE_ON = _code(StyleCode.REVERSE.value + STYLE_ON_OFFSET)
+_STRIKETHROUGH_ON = _code(StyleCode.STRIKETHROUGH.value + STYLE_ON_OFFSET)
 
-def _reset(s: str) -> str:
-    return f"{_code(0)}{s}"
+
+@functools.lru_cache(maxsize=None)
+def _ansi_prefix(
+    fg: ColorType | None = None,
+    bg: ColorType | None = None,
+    bold: bool = False,
+    italic: bool = False,
+    dim: bool = False,
+    underline: bool = False,
+    blink: bool = False,
+    reverse: bool = False,
+    strikethrough: bool = False,
+    reset: bool = False,
+) -> tuple[str, str]:
+    """
+    Computes the escape sequences that need to go before and after a string
+    to style it. They only depend on the styles so we can cache them.
+    """
+    # From the innermost to the outermost style
+    starts: list[str] = []
+    ends: list[str] = []
+    if fg:
+        start, end = _FG_WRAP[fg]
+        starts.append(start)
+        ends.append(end)
+    if bg:
+        start, end = _BG_WRAP[bg]
+        starts.append(start)
+        ends.append(end)
+
+    styles = (
+        (_BOLD_ON, bold),
+        (_ITALIC_ON, italic),
+        (_DIM_ON, dim),
+        (_UNDERLINE_ON, underline),
+        (_BLINK_ON, blink),
+        (_REVERSE_ON, reverse),
+        (_STRIKETHROUGH_ON, strikethrough),
+    )
+    for start, enabled in styles:
+        if enabled:
+            starts.append(start)
+            ends.append(_RESET_ALL)
+
+    if reset:
+        starts.append(_RESET_ALL)
+
+    return "".join(reversed(starts)), "".join(ends)
 
 
 def remove_style(s: str):
+    # Most strings are not styled so we can skip the regex entirely
+    if "\x1b" not in s:
+        return s
     return ANSI_ESCAPE.sub("", s)
 
 
+def _join(messages: tuple[t.Any, ...]) -> str:
+    """
+    Same as joining the messages with spaces but without going through
+    str.join for the common case of one or two messages
+    """
+    n = len(messages)
+    if n == 1:
+        m = messages[0]
+        return m if type(m) is str else str(m)
+    if n == 2:
+        a, b = messages
+        return (
+            (a if type(a) is str else str(a)) + " " + (b if type(b) is str else str(b))
+        )
+    return " ".join(map(str, messages))
+
+
 class Styler(t.Protocol):
     def __call__(self, *args: t.Any) -> str: ...
 
 
+@functools.lru_cache(maxsize=256)
+def _cached_styler(
+    fg: ColorType | None,
+    bg: ColorType | None,
+    bold: bool,
+    italic: bool,
+    dim: bool,
+    underline: bool,
+    blink: bool,
+    reverse: bool,
+    strikethrough: bool,
+    reset: bool,
+) -> Styler:
+    """
+    Stylers hold no state so we can share them between calls with the same styles
+    """
+    prefix, suffix = _ansi_prefix(
+        fg, bg, bold, italic, dim, underline, blink, reverse, strikethrough, reset
+    )
+
+    def inner(*messages: t.Any):
+        return prefix + _join(messages) + suffix
+
+    return inner
+
+
 def styler(
     fg: ColorType | None = None,
     bg: ColorType | None = None,
@@ -124,21 +221,9 @@ def styler(
     strikethrough: bool = False,
     reset: bool = False,
 ) -> Styler:
-    def inner(*messages: t.Any):
-        text = " ".join(str(m) for m in messages)
-        text = _apply_fg(text, fg) if fg else text
-        text = _apply_bg(text, bg) if bg else text
-        text = _apply_style(text, StyleCode.BOLD) if bold else text
-        text = _apply_style(text, StyleCode.ITALIC) if italic else text
-        text = _apply_style(text, StyleCode.DIM) if dim else text
-        text = _apply_style(text, StyleCode.UNDERLINE) if underline else text
-        text = _apply_style(text, StyleCode.BLINK) if blink else text
-        text = _apply_style(text, StyleCode.REVERSE) if reverse else text
-        text = _apply_style(text, StyleCode.STRIKETHROUGH) if strikethrough else text
-        text = _reset(text) if reset else text
-        return text
-
-    return inner
+    return _cached_styler(
+        fg, bg, bold, italic, dim, underline, blink, reverse, strikethrough, reset
+    )
 
 
 def style(
@@ -154,17 +239,23 @@ def style(
     strikethrough: bool = False,
     reset: bool = False,
 ) -> str:
-    return styler(
-        fg=fg,
-        bg=bg,
-        bold=bold,
-        italic=italic,
-        dim=dim,
-        underline=underline,
-        blink=blink,
-        reverse=reverse,
-        strikethrough=strikethrough,
-        reset=reset,
+    # Nothing to style, just join the messages
+    if not (
+        fg
+        or bg
+        or bold
+        or italic
+        or dim
+        or underline
+        or blink
+        or reverse
+        or strikethrough
+        or reset
+    ):
+        return _join(messages)
+
+    return _cached_styler(
+        fg, bg, bold, italic, dim, underline, blink, reverse, strikethrough, reset
     )(*messages)
 
 
@@ -182,17 +273,16 @@ def print(
     reset: bool = False,
     end: str | None = "\n",
 ):
-    text = style(
-        *messages,
-        fg=fg,
-        bg=bg,
-        bold=bold,
-        italic=italic,
-        dim=dim,
-        underline=underline,
-        blink=blink,
-        reverse=reverse,
-        strikethrough=strikethrough,
-        reset=reset,
+    # Same as the builtin print, nowhere to write to
+    stdout = sys.stdout
+    if stdout is None:
+        return
+
+    prefix, suffix = _ansi_prefix(
+        fg, bg, bold, italic, dim, underline, blink, reverse, strikethrough, reset
     )
-    builtins.print(text, end=end)
+
+    # Write each part as is instead of building the whole styled string first
+    stdout.write(prefix)
+    stdout.write(_join(messages))
+    stdout.write(suffix + ("\n" if end is None else end))
@@ -13,11 +13,6 @@ def _error(msg: str):
     clypi.print(msg, fg="red")
 
 
-def _input(prompt: str, hide_input: bool) -> str:
-    fun = getpass if hide_input else input
-    return fun(clypi.style(prompt, fg="blue", bold=True))
-
-
 class MaxAttemptsException(Exception):
     pass
 
@@ -82,10 +77,12 @@ def prompt(
     if default is not _UNSET:
         prompt += f" [{default}]"
     prompt += ": "
+    styled_prompt = clypi.style(prompt, fg="blue", bold=True)
+    read_input = getpass if hide_input else input
 
     # Loop until we get a valid value
     for _ in range(max_attempts):
-        inp = _input(prompt, hide_input=hide_input)
+        inp = read_input(styled_prompt)
 
         # User hit enter without a value
         if inp == "":
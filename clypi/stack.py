@@ -25,7 +25,10 @@ def stack(*blocks: list[str], padding: int = 1) -> str: ...
 def stack(*blocks: list[str], padding: int = 1, lines: bool = False) -> str | list[str]:
     new_lines = []
     height = max(len(b) for b in blocks)
-    widths = [max(_real_len(line) for line in block) for block in blocks]
+
+    # Compute the visible length of each line once, it's expensive for styled lines
+    lengths = [[_real_len(line) for line in block] for block in blocks]
+    widths = [max(block_lengths) for block_lengths in lengths]
 
     # Process line until all blocks are done
     for idx in range(height):
@@ -33,14 +36,15 @@ def stack(*blocks: list[str], padding: int = 1, lines: bool = False) -> str | li
         tmp: list[str] = []
 
         # Add the line from each block
-        for block, width in zip(blocks, widths):
+        for block, block_lengths, width in zip(blocks, lengths, widths):
             # If there was a line, next iter will happen
             block_line = _safe_get(block, idx)
             if block_line:
                 more |= True
 
             # How much do we need to reach the actual visible length
-            actual_width = (width - _real_len(block_line)) + len(block_line)
+            real_len = block_lengths[idx] if idx < len(block_lengths) else 0
+            actual_width = (width - real_len) + len(block_line)
 
             # Align and append line
             tmp.append(block_line.ljust(actual_width))
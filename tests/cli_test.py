@@ -1,10 +1,14 @@
 import asyncio
+import typing as t
+from dataclasses import dataclass
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
 from typing_extensions import override
 
 from clypi import Command, config
+from clypi._cli import type_util
 
 
 class ExampleSubCommand(Command):
@@ -45,6 +49,27 @@ def test_expected_base():
     assert ExampleCommand.epilog() == "Some text to display after..."
 
 
+def test_expected_base_command():
+    assert Command.help() is None
+    assert Command.prog() == "command"
+    assert Command.fields() == {}
+    assert Command.options() == {}
+    assert Command.positionals() == {}
+    assert Command.subcommands() == {None: None}
+
+
+def test_expected_help_ignores_dataclass_docstring():
+    class Parent(Command):
+        """Parent docs"""
+
+    @dataclass
+    class Child(Parent):
+        pass
+
+    assert Parent.help() == "Parent docs"
+    assert Child.help() is None
+
+
 def test_expected_options():
     opts = ExampleCommand.options()
     assert len(opts) == 2
@@ -79,6 +104,12 @@ def test_expected_subcommands():
     assert sub.help() == "Some sample docs"
 
 
+def test_expected_arguments_are_cached():
+    assert ExampleCommand.options() is ExampleCommand.options()
+    assert ExampleSubCommand.positionals() is ExampleSubCommand.positionals()
+    assert ExampleCommand.subcommands() is ExampleCommand.subcommands()
+
+
 @patch("os.get_terminal_size")
 def test_expected_parsing(gts):
     gts.return_value = MagicMock()
@@ -92,6 +123,59 @@ def test_expected_parsing(gts):
     assert asyncio.run(ec.astart()) == "main"
 
 
+class ShortsCommand(Command):
+    name: str = config(short="n")
+    flag: bool = config(default=False, short="f")
+    option: list[str] = config(short="o", default_factory=list)
+
+
+def test_expected_parsing_short_options():
+    sc = ShortsCommand.parse(["-o", "a", "b", "-f", "x"])
+    assert sc.flag is True
+    assert sc.option == ["a", "b"]
+    assert sc.name == "x"
+
+
+@patch("os.get_terminal_size")
+def test_expected_parsing_short_positional(gts):
+    gts.return_value = MagicMock()
+    gts.return_value.columns = 80
+
+    # Only options can be passed in by their short name
+    with pytest.raises(SystemExit) as exc:
+        ShortsCommand.parse(["-n", "x"])
+    assert exc.value.code == 1
+
+
+def test_expected_parsing_union_order():
+    class IntFirst(Command):
+        value: int | str = 0
+
+    class StrFirst(Command):
+        value: str | int = "default"
+
+    assert IntFirst.parse(["--value", "5"]).value == 5
+    assert StrFirst.parse(["--value", "5"]).value == "5"
+    assert IntFirst.parse(["--value", "5"]).value == 5
+
+
+def test_expected_type_str_order():
+    assert type_util.type_to_str(t.Literal["a", "b"]) == "{a|b}"
+    assert type_util.type_to_str(t.Literal["b", "a"]) == "{b|a}"
+    assert t.get_args(type_util.remove_optionality(int | str | None)) == (int, str)
+    assert t.get_args(type_util.remove_optionality(str | int | None)) == (str, int)
+
+
+def test_expected_unhashable_types_with_parser():
+    class Unhashable(Command):
+        func: t.Callable[[str], int] = config(parser=lambda _: len, default=len)
+        meta: t.Annotated[int, {"k": 1}] = config(parser=int, default=0)
+
+    cmd = Unhashable.parse(["--meta", "3"])
+    assert cmd.meta == 3
+    assert cmd.func is len
+
+
 @patch("os.get_terminal_size")
 def test_expected_parsing_subcmd(gts):
     gts.return_value = MagicMock()
@@ -0,0 +1,83 @@
+from pytest import mark
+
+from clypi import Command, config
+from clypi._cli import parser
+from clypi._levenshtein import _py_distance
+
+
+def _full_distance(this: str, other: str) -> int:
+    n, m = len(this), len(other)
+    dist = [[0 for _ in range(m + 1)] for _ in range(n + 1)]
+    for i in range(n + 1):
+        dist[i][0] = i
+    for j in range(m + 1):
+        dist[0][j] = j
+
+    for i in range(n):
+        for j in range(m):
+            dist[i + 1][j + 1] = min(
+                dist[i][j + 1] + 1,
+                dist[i + 1][j] + 1,
+                dist[i][j] + (1 if this[i] != other[j] else 0),
+            )
+    return dist[n][m]
+
+
+PAIRS = [
+    ("", ""),
+    ("", "abc"),
+    ("abc", ""),
+    ("flag", "flag"),
+    ("flag", "falg"),
+    ("flag", "flags"),
+    ("option", "opt"),
+    ("kitten", "sitting"),
+    ("subcommand", "sub-command"),
+    ("abc", "xyz"),
+]
+
+
+@mark.parametrize("this,other", PAIRS)
+def test_distance(this: str, other: str):
+    assert _py_distance(this, other) == _full_distance(this, other)
+
+
+@mark.parametrize("this,other", PAIRS)
+@mark.parametrize("max_dist", [0, 1, 2])
+def test_distance_max_dist(this: str, other: str, max_dist: int):
+    expected = _full_distance(this, other)
+    if expected > max_dist:
+        expected = max_dist + 1
+    assert _py_distance(this, other, max_dist) == expected
+
+
+def test_distance_length_prefilter():
+    assert _py_distance("a", "abcdef", max_dist=2) == 3
+    assert _py_distance("", "abc", max_dist=1) == 2
+    assert _py_distance("", "ab", max_dist=2) == 2
+
+
+class Sub(Command):
+    pass
+
+
+class Main(Command):
+    subcommand: Sub | None = None
+    flag: bool = False
+    verbose: bool = config(default=False, short="v")
+
+
+@mark.parametrize(
+    "arg,expected",
+    [
+        ("--falg", "Unknown option '--falg'. Did you mean '--flag'?"),
+        ("--verbos", "Unknown option '--verbos'. Did you mean '--verbose'?"),
+        ("-w", "Unknown option '-w'. Did you mean '-v'?"),
+        ("--nothing-like-it", "Unknown option '--nothing-like-it'"),
+        ("sbu", "Unknown argument 'sbu'. Did you mean 'sub'?"),
+        ("something", "Unknown argument 'something'"),
+    ],
+)
+def test_find_similar(arg: str, expected: str):
+    exc = Main._find_similar_exc(parser.parse_as_attr(arg))
+    assert str(exc) == expected
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import io
-import re
 import sys
+import typing as t
 from contextlib import contextmanager
 from datetime import date, datetime, timedelta
 
@@ -10,6 +10,7 @@ import pytest
 from pytest import mark
 
 import clypi
+from clypi.colors import remove_style
 from clypi.prompts import MaxAttemptsException, Parser
 
 
@@ -34,11 +35,7 @@ def replace_stdout():
 
 
 def _escape_ansi(line: str) -> str:
-    """
-    https://stackoverflow.com/questions/14693701/how-can-i-remove-the-ansi-escape-sequences-from-a-string-in-python
-    """
-    ansi_escape = re.compile(r"(?:\x1B[@-_]|[\x80-\x9F])[0-?]*[ -/]*[@-~]")
-    return ansi_escape.sub("", line)
+    return remove_style(line)
 
 
 def assert_prompted_times(prompted: io.StringIO, times: int):
@@ -116,3 +113,61 @@ def _raise_error(x: str) -> None:
 def test_prompt_with_bad_validate():
     with replace_stdin("2") as _, pytest.raises(MaxAttemptsException):
         clypi.prompt("Some prompt", parser=_raise_error, max_attempts=1)
+
+
+@mark.parametrize(
+    "kwargs,expected",
+    [
+        ({}, "hi 1"),
+        ({"fg": "red"}, "\x1b[31mhi 1\x1b[39m"),
+        ({"bg": "blue"}, "\x1b[44mhi 1\x1b[49m"),
+        (
+            {"fg": "bright_green", "bg": "bright_default"},
+            "\x1b[109m\x1b[92mhi 1\x1b[39m\x1b[49m",
+        ),
+        ({"bold": True}, "\x1b[1mhi 1\x1b[0m"),
+        (
+            {"fg": "red", "bg": "blue", "bold": True, "underline": True},
+            "\x1b[4m\x1b[1m\x1b[44m\x1b[31mhi 1\x1b[39m\x1b[49m\x1b[0m\x1b[0m",
+        ),
+        (
+            {
+                "fg": "cyan",
+                "italic": True,
+                "dim": True,
+                "blink": True,
+                "reverse": True,
+                "strikethrough": True,
+            },
+            "\x1b[9m\x1b[7m\x1b[5m\x1b[2m\x1b[3m\x1b[36mhi 1"
+            "\x1b[39m\x1b[0m\x1b[0m\x1b[0m\x1b[0m\x1b[0m",
+        ),
+        ({"fg": "red", "reset": True}, "\x1b[0m\x1b[31mhi 1\x1b[39m"),
+        ({"reset": True}, "\x1b[0mhi 1"),
+    ],
+)
+def test_style(kwargs: dict[str, t.Any], expected: str):
+    assert clypi.style("hi", 1, **kwargs) == expected
+    assert clypi.styler(**kwargs)("hi", 1) == expected
+    assert remove_style(expected) == "hi 1"
+
+
+def test_style_messages():
+    assert clypi.style("hi", fg="red") == "\x1b[31mhi\x1b[39m"
+    assert clypi.style(1, fg="red") == "\x1b[31m1\x1b[39m"
+    assert clypi.style("a", "b", 3, fg="red") == "\x1b[31ma b 3\x1b[39m"
+    assert clypi.style() == ""
+
+
+@mark.parametrize(
+    "end,expected",
+    [
+        ("\n", "\x1b[1m\x1b[31mhi 2\x1b[39m\x1b[0m\n"),
+        (None, "\x1b[1m\x1b[31mhi 2\x1b[39m\x1b[0m\n"),
+        ("", "\x1b[1m\x1b[31mhi 2\x1b[39m\x1b[0m"),
+    ],
+)
+def test_print(end: str | None, expected: str):
+    with replace_stdout() as stdout:
+        clypi.print("hi", 2, fg="red", bold=True, end=end)
+    assert stdout.getvalue() == expected